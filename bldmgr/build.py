@@ -1,18 +1,53 @@
 #!/usr/bin/env python3
 import sys
 import os
-import importlib
 
 # Add the project root to the path to allow importing build_logic and project configs.
+# Other modules are imported where they are used, so that paths which never reach
+# them (like the usage message) do not pay for loading them.
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-from build_logic import Builder
 
 def find_projects(root_dir='.'):
-    """Finds all project directories (prefixed with 'prj_') in the root directory."""
-    return [
-        item for item in os.listdir(root_dir)
-        if os.path.isdir(os.path.join(root_dir, item)) and item.startswith("prj_")
-    ]
+    """
+    Finds all project directories (prefixed with 'prj_') in the root directory.
+
+    The result is cached in '.bldmgr_cache.json' together with the modification
+    time of the root directory, which changes whenever an entry is added, removed,
+    or renamed. A warm run therefore needs a single stat instead of a full scan.
+    """
+    import json
+
+    root_mtime = os.stat(root_dir).st_mtime_ns
+    cache_path = os.path.join(root_dir, ".bldmgr_cache.json")
+    try:
+        with open(cache_path, 'r') as f:
+            cache = json.load(f)
+        if cache["mtime"] == root_mtime:
+            return cache["projects"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    # os.scandir serves is_dir() from the directory entry itself, and the name
+    # filter runs first so most entries are rejected without any extra syscall.
+    with os.scandir(root_dir) as entries:
+        projects = [
+            entry.name for entry in entries
+            if entry.name.startswith("prj_") and entry.is_dir(follow_symlinks=False)
+        ]
+
+    try:
+        with open(cache_path, 'w') as f:
+            json.dump({"mtime": root_mtime, "projects": projects}, f)
+        # Creating the cache file changes the root directory's mtime itself, so
+        # store the mtime seen after the write. Rewriting the now existing file
+        # leaves the directory untouched.
+        written_mtime = os.stat(root_dir).st_mtime_ns
+        if written_mtime != root_mtime:
+            with open(cache_path, 'w') as f:
+                json.dump({"mtime": written_mtime, "projects": projects}, f)
+    except OSError:
+        pass  # The cache is only an optimization; a read-only checkout still works.
+    return projects
 
 def print_usage(projects):
     """Prints the available commands and their descriptions."""
@@ -47,6 +82,9 @@ def main():
 
     project_name = sys.argv[1]
 
+    import importlib
+    from build_logic import Builder
+
     # Dynamically import the project's config file
     try:
         config_module_path = f"{project_name}.config"
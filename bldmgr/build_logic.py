@@ -2,66 +2,314 @@ import os
 import subprocess
 import shutil
 import sys
-import re
-import urllib.request
-import zipfile
-import tarfile
+import shlex
+import hashlib
+import functools
+import pickle
+import struct
+import threading
+import time
+from itertools import chain
+from concurrent.futures import ThreadPoolExecutor, as_completed
+# urllib.request, zipfile, tarfile and gzip are only needed to set up missing
+# tools, so they are imported by the functions below rather than on every build.
 
-def _download_and_extract_tool(url: str, archive_path: str, extract_dir: str, final_check_path: str, rename_map: dict = None):
+def _extract_tar_gz_stream(stream, extract_dir: str, advance):
     """
-    Downloads, extracts, and optionally renames a tool archive.
+    Extracts a .tar.gz archive while it is being read from 'stream' (an HTTP
+    response), so download and extraction overlap and the archive is never
+    written to disk. 'advance' is called with the size of every chunk read.
 
-    Args:
-        url (str): The URL to download the tool archive from.
-        archive_path (str): The local path where the downloaded archive will be saved.
-        extract_dir (str): The directory where the archive will be extracted.
-        final_check_path (str): A path to a key file or directory inside the extracted
-                                contents to verify successful setup.
-        rename_map (dict, optional): A map of {original_name: new_name} for renaming
-                                     extracted directories. Defaults to None.
+    External tools are preferred, being much faster than the tarfile module:
+    'pigz' (multi-threaded gzip) piped into 'tar' when both are installed,
+    otherwise the system 'tar' alone (also shipped with Windows 10 and later).
+    The fallback reads the stream sequentially with tarfile's 'r|gz' mode.
     """
-    print(f"    -> Downloading from {url}")
+    tar = shutil.which("tar")
+    if tar:
+        pigz = shutil.which("pigz")
+        if pigz:
+            unzip = subprocess.Popen([pigz, "-dc"], stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+            untar = subprocess.Popen([tar, "-xf", "-", "-C", extract_dir], stdin=unzip.stdout)
+            unzip.stdout.close()  # Owned by tar now.
+            procs = [unzip, untar]
+        else:
+            procs = [subprocess.Popen([tar, "-xzf", "-", "-C", extract_dir], stdin=subprocess.PIPE)]
+        sink = procs[0].stdin
+        try:
+            while True:
+                chunk = stream.read(_DOWNLOAD_CHUNK_SIZE)
+                if not chunk:
+                    break
+                sink.write(chunk)
+                advance(len(chunk))
+        finally:
+            try:
+                sink.close()
+            except OSError:
+                pass
+            for proc in procs:
+                proc.wait()
+        for proc in procs:
+            if proc.returncode != 0:
+                raise subprocess.CalledProcessError(proc.returncode, proc.args)
+        return
+
+    import tarfile
+
+    class CountingReader:
+        def read(self, size=-1):
+            data = stream.read(size)
+            advance(len(data))
+            return data
+
+    # Read the compressed stream and copy the members with 2 MiB buffers instead
+    # of tarfile's 10 KiB records and 16 KiB copies.
+    with tarfile.open(fileobj=CountingReader(), mode='r|gz', bufsize=2 << 20, copybufsize=2 << 20) as tar_ref:
+        tar_ref.extractall(extract_dir)
+
+# Members of a .zip archive are extracted by this many threads at once.
+_ZIP_EXTRACT_WORKERS = 8
+
+def _extract_zip(archive_path: str, extract_dir: str):
+    """
+    Extracts a .zip archive with a pool of threads and large copy buffers.
+
+    Members are independent once the central directory has been read, and
+    extracting thousands of small files is dominated by per-file open/close
+    latency (and, on Windows, by the virus scanner), so several members are
+    extracted at once. Each thread reads through its own ZipFile handle, as a
+    shared handle serialises all reads. Copies use buffers of up to 1 MiB
+    instead of ZipFile.extractall()'s small default ones, and Unix permission
+    bits stored in the archive are restored.
+    """
+    import zipfile
+    root = os.path.abspath(extract_dir)
+    with zipfile.ZipFile(archive_path, 'r') as zip_ref:
+        infos = zip_ref.infolist()
+
+    files = []
+    for info in infos:
+        dest = os.path.abspath(os.path.join(root, info.filename))
+        # Refuse members that would be written outside the target directory.
+        if os.path.commonpath([root, dest]) != root:
+            raise ValueError(f"Unsafe path in archive: '{info.filename}'")
+        if info.is_dir():
+            os.makedirs(dest, exist_ok=True)
+        else:
+            os.makedirs(os.path.dirname(dest), exist_ok=True)
+            files.append((info, dest))
+
+    local = threading.local()
+    handles = []
+    handles_lock = threading.Lock()
+
+    def extract(info, dest):
+        zip_ref = getattr(local, "zip_ref", None)
+        if zip_ref is None:
+            zip_ref = local.zip_ref = zipfile.ZipFile(archive_path, 'r')
+            with handles_lock:
+                handles.append(zip_ref)
+        if info.file_size:
+            with zip_ref.open(info) as src, open(dest, 'wb') as dst:
+                shutil.copyfileobj(src, dst, min(info.file_size, 1 << 20))
+        else:
+            open(dest, 'wb').close()
+        mode = (info.external_attr >> 16) & 0o777
+        if mode:
+            os.chmod(dest, mode)
+
     try:
-        with urllib.request.urlopen(url) as response, open(archive_path, 'wb') as out_file:
+        with ThreadPoolExecutor(max_workers=_ZIP_EXTRACT_WORKERS) as executor:
+            for future in [executor.submit(extract, *member) for member in files]:
+                future.result()
+    finally:
+        for zip_ref in handles:
+            zip_ref.close()
+
+# Files at least this large are downloaded in _RANGE_DOWNLOAD_PARTS parallel parts.
+_RANGE_DOWNLOAD_MIN_SIZE = 8 << 20
+_RANGE_DOWNLOAD_PARTS = 8
+
+# Downloads are read in chunks of this size; the progress bar is redrawn at most
+# every _PROGRESS_INTERVAL seconds (10 Hz).
+_DOWNLOAD_CHUNK_SIZE = 256 << 10
+_PROGRESS_INTERVAL = 0.1
+
+# Every state of the progress bar is a slice of one precomputed template.
+_BAR_LENGTH = 40
+_BAR_TEMPLATE = '█' * _BAR_LENGTH + '-' * _BAR_LENGTH
+
+def _progress_reporter(total_size: int):
+    """
+    Returns a thread-safe callback that adds a number of downloaded bytes and
+    redraws the progress bar, at most every _PROGRESS_INTERVAL seconds and once
+    the download is complete.
+    """
+    lock = threading.Lock()
+    state = {"downloaded": 0, "drawn_at": float("-inf")}
+
+    def advance(count):
+        with lock:
+            state["downloaded"] += count
+            downloaded_size = state["downloaded"]
+            now = time.monotonic()
+            if now - state["drawn_at"] < _PROGRESS_INTERVAL and downloaded_size < total_size:
+                return
+            state["drawn_at"] = now
+
+            # Draw progress bar
+            progress = downloaded_size / total_size
+            filled_length = int(_BAR_LENGTH * progress)
+            bar = _BAR_TEMPLATE[_BAR_LENGTH - filled_length:2 * _BAR_LENGTH - filled_length]
+            percent = progress * 100
+            sys.stdout.write(f"\r      [{bar}] {percent:.1f}% ({downloaded_size/1024/1024:.1f}/{total_size/1024/1024:.1f} MB)")
+            sys.stdout.flush()
+
+    return advance
+
+def _download_ranges(url: str, archive_path: str, total_size: int) -> bool:
+    """
+    Downloads a file in parallel parts using HTTP Range requests, one connection
+    per part, writing each part at its offset in the pre-sized output file.
+
+    Returns:
+        bool: False, before anything is written, if the server answers the first
+              Range request with the whole file; the caller then downloads the
+              file as a single stream.
+    """
+    import urllib.request
+    part_size = -(-total_size // _RANGE_DOWNLOAD_PARTS)
+    ranges = [(start, min(start + part_size, total_size) - 1) for start in range(0, total_size, part_size)]
+
+    def open_range(start, end):
+        request = urllib.request.Request(url, headers={"Range": f"bytes={start}-{end}"})
+        response = urllib.request.urlopen(request)
+        if response.status != 206:
+            response.close()
+            return None
+        return response
+
+    first = open_range(*ranges[0])
+    if first is None:
+        return False
+
+    with open(archive_path, 'wb') as out_file:
+        out_file.truncate(total_size)
+    advance = _progress_reporter(total_size)
+
+    def fetch(start, end, response=None):
+        response = response or open_range(start, end)
+        if response is None:
+            raise OSError(f"Server ignored the Range request for bytes {start}-{end}")
+        received = 0
+        with response, open(archive_path, 'r+b', buffering=1 << 20) as out_file:
+            out_file.seek(start)
+            while True:
+                chunk = response.read(_DOWNLOAD_CHUNK_SIZE)
+                if not chunk:
+                    break
+                out_file.write(chunk)
+                received += len(chunk)
+                advance(len(chunk))
+        if received != end - start + 1:
+            raise OSError(f"Incomplete download of bytes {start}-{end}")
+
+    with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+        futures = [executor.submit(fetch, *ranges[0], first)]
+        futures += [executor.submit(fetch, *r) for r in ranges[1:]]
+        for future in futures:
+            future.result()
+    print()  # Newline after the progress bar is complete
+    return True
+
+def _download_and_extract_zip(url: str, archive_path: str, extract_dir: str, sha256: str = None):
+    """
+    Downloads a .zip archive to 'archive_path', extracts it and removes it.
+    Unlike a tarball, a zip archive keeps its index at the end, so it cannot be
+    extracted while it downloads. If 'sha256' is given, the archive is verified
+    before anything is extracted.
+
+    A single-stream download is written to 'archive_path.part' first; if an
+    earlier download was interrupted, it resumes where that file ends with an
+    HTTP Range request.
+    """
+    import urllib.request
+    import urllib.error
+    part_path = archive_path + ".part"
+
+    def open_from(offset):
+        # 'identity' keeps the server from compressing the transfer, which would
+        # make the byte offsets of a Range request meaningless.
+        headers = {"Accept-Encoding": "identity"}
+        if offset:
+            headers["Range"] = f"bytes={offset}-"
+        return urllib.request.urlopen(urllib.request.Request(url, headers=headers))
+
+    try:
+        ranged = False
+        try:
+            offset = os.path.getsize(part_path)
+        except OSError:
+            offset = 0
+        try:
+            response = open_from(offset)
+        except urllib.error.HTTPError as e:
+            if e.code != 416 or not offset:
+                raise
+            # Range Not Satisfiable: the partial file does not match the archive.
+            os.remove(part_path)
+            offset = 0
+            response = open_from(0)
+        with response:
+            if offset and response.status != 206:
+                # The server ignored the Range request and sent the whole file.
+                os.remove(part_path)
+                offset = 0
+            elif offset:
+                print(f"    -> Resuming download at {offset/1024/1024:.1f} MB...")
             total_size_str = response.getheader('Content-Length')
-            if total_size_str:
-                total_size = int(total_size_str)
-                downloaded_size = 0
-                chunk_size = 8192  # 8 KB chunks
-
-                while True:
-                    chunk = response.read(chunk_size)
-                    if not chunk:
-                        break
-                    out_file.write(chunk)
-                    downloaded_size += len(chunk)
-
-                    # Draw progress bar
-                    progress = downloaded_size / total_size
-                    bar_length = 40
-                    filled_length = int(bar_length * progress)
-                    bar = '█' * filled_length + '-' * (bar_length - filled_length)
-                    percent = progress * 100
-                    print(f"\r      [{bar}] {percent:.1f}% ({downloaded_size/1024/1024:.1f}/{total_size/1024/1024:.1f} MB)", end="")
-                print()  # Newline after the progress bar is complete
-            else:
-                # Fallback if Content-Length is not provided
-                print("    -> Downloading (size unknown)...")
-                shutil.copyfileobj(response, out_file)
-                print("    -> Download complete.")
+            total_size = int(total_size_str) if total_size_str else 0
+            # Large files from servers that support Range requests (such as the
+            # GitHub release CDN) are fetched over several connections at once.
+            # 'geturl()' is the final URL after redirects.
+            if not offset and total_size >= _RANGE_DOWNLOAD_MIN_SIZE and response.getheader('Accept-Ranges') == 'bytes':
+                ranged = _download_ranges(response.geturl(), archive_path, total_size)
+            if not ranged:
+                with open(part_path, 'ab' if offset else 'wb', buffering=1 << 20) as out_file:
+                    if total_size:
+                        advance = _progress_reporter(offset + total_size)
+                        advance(offset)
+                        while True:
+                            chunk = response.read(_DOWNLOAD_CHUNK_SIZE)
+                            if not chunk:
+                                break
+                            out_file.write(chunk)
+                            advance(len(chunk))
+                        print()  # Newline after the progress bar is complete
+                    else:
+                        # Fallback if Content-Length is not provided
+                        print("    -> Downloading (size unknown)...")
+                        shutil.copyfileobj(response, out_file)
+                        print("    -> Download complete.")
+                os.replace(part_path, archive_path)
     except Exception as e:
         print(f"\n❌ Error: Failed to download tool. Reason: {e}", file=sys.stderr)
         print("Please check your internet connection or download it manually as per README.md.", file=sys.stderr)
+        print("Run the build again to resume the download.", file=sys.stderr)
         sys.exit(1)
 
+    if sha256:
+        actual = _file_digest(archive_path, "sha256").hex()
+        if actual != sha256.lower():
+            os.remove(archive_path)
+            print(f"❌ Error: Checksum mismatch for {url}: expected SHA-256 {sha256}, got {actual}.", file=sys.stderr)
+            print("The download is corrupt or has been tampered with.", file=sys.stderr)
+            sys.exit(1)
+
     print(f"    -> Extracting {os.path.basename(archive_path)}...")
     try:
-        if archive_path.endswith(".zip"):
-            with zipfile.ZipFile(archive_path, 'r') as zip_ref:
-                zip_ref.extractall(extract_dir)
-        elif archive_path.endswith(".tar.gz"):
-            with tarfile.open(archive_path, 'r:gz') as tar_ref:
-                tar_ref.extractall(extract_dir)
+        _extract_zip(archive_path, extract_dir)
     except Exception as e:
         print(f"❌ Error: Failed to extract tool. Reason: {e}", file=sys.stderr)
         print("Please ensure you have permissions and the archive is not corrupt.", file=sys.stderr)
@@ -69,6 +317,89 @@ def _download_and_extract_tool(url: str, archive_path: str, extract_dir: str, fi
     finally:
         os.remove(archive_path)
 
+def _download_and_extract_tool(url: str, archive_path: str, extract_dir: str, final_check_path: str, rename_map: dict = None, fallback_url: str = None, checksums: dict = None):
+    """
+    Downloads, extracts, and optionally renames a tool archive.
+
+    Args:
+        url (str): The URL to download the tool archive from.
+        archive_path (str): The local path where the downloaded archive will be saved.
+                            Only used for .zip archives; .tar.gz archives are
+                            extracted while they download.
+        extract_dir (str): The directory where the archive will be extracted.
+        final_check_path (str): A path to a key file or directory inside the extracted
+                                contents to verify successful setup.
+        rename_map (dict, optional): A map of {original_name: new_name} for renaming
+                                     extracted directories. Defaults to None.
+        fallback_url (str, optional): A .zip archive of the same tool, downloaded
+                                      instead if the .tar.gz 'url' does not exist.
+        checksums (dict, optional): Known SHA-256 digests (hex) of the archives, by
+                                    URL. A listed archive that does not match is
+                                    rejected.
+    """
+    import urllib.request
+    import urllib.error
+    checksums = checksums or {}
+    print(f"    -> Downloading from {url}")
+    if archive_path.endswith(".tar.gz"):
+        response = None
+        digest = hashlib.sha256()
+        # The archive is extracted as it streams in, before its checksum is
+        # known, so extract into a staging directory and move the contents into
+        # place only once the archive has been verified.
+        staging_dir = os.path.join(extract_dir, ".extracting")
+        shutil.rmtree(staging_dir, ignore_errors=True)
+        os.makedirs(staging_dir)
+        try:
+            try:
+                response = urllib.request.urlopen(url)
+            except urllib.error.HTTPError as e:
+                if e.code != 404 or not fallback_url:
+                    raise
+            if response:
+                with response:
+                    # Hash the archive as it streams past, at no extra I/O cost.
+                    class HashingReader:
+                        def read(self, size=-1):
+                            data = response.read(size)
+                            digest.update(data)
+                            return data
+
+                    total_size_str = response.getheader('Content-Length')
+                    print("    -> Extracting while downloading...")
+                    if total_size_str:
+                        _extract_tar_gz_stream(HashingReader(), staging_dir, _progress_reporter(int(total_size_str)))
+                        print()  # Newline after the progress bar is complete
+                    else:
+                        _extract_tar_gz_stream(HashingReader(), staging_dir, lambda count: None)
+        except Exception as e:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+            print(f"\n❌ Error: Failed to download and extract tool. Reason: {e}", file=sys.stderr)
+            print("Please check your internet connection or download it manually as per README.md.", file=sys.stderr)
+            sys.exit(1)
+        if not response:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+            # Not every release ships a tarball; use the .zip archive instead.
+            print(f"    -> No .tar.gz archive available, downloading from {fallback_url}")
+            _download_and_extract_zip(fallback_url, archive_path[:-len(".tar.gz")] + ".zip", extract_dir,
+                                      sha256=checksums.get(fallback_url))
+        elif checksums.get(url) and digest.hexdigest() != checksums[url].lower():
+            # Discard everything the unverified archive produced.
+            shutil.rmtree(staging_dir, ignore_errors=True)
+            print(f"❌ Error: Checksum mismatch for {url}: expected SHA-256 {checksums[url]}, got {digest.hexdigest()}.", file=sys.stderr)
+            print("The download is corrupt or has been tampered with.", file=sys.stderr)
+            sys.exit(1)
+        else:
+            for name in os.listdir(staging_dir):
+                dst_path = os.path.join(extract_dir, name)
+                # Replace the leftovers of an earlier, incomplete setup.
+                if os.path.isdir(dst_path):
+                    shutil.rmtree(dst_path)
+                os.replace(os.path.join(staging_dir, name), dst_path)
+            os.rmdir(staging_dir)
+    else:
+        _download_and_extract_zip(url, archive_path, extract_dir, sha256=checksums.get(url))
+
     if rename_map:
         for src, dst in rename_map.items():
             src_path = os.path.join(extract_dir, src)
@@ -86,6 +417,173 @@ def _download_and_extract_tool(url: str, archive_path: str, extract_dir: str, fi
     
     print("    -> Tool setup successful.")
 
+# Maps each supported source file extension to the kind of compile step.
+_SOURCE_KINDS = {
+    ".c": "cc",
+    ".cpp": "cxx", ".cc": "cxx", ".cxx": "cxx",
+    ".s": "as", ".S": "as",
+}
+
+# Parsed .d files are kept between builds in this file in the build directory.
+# Bump the version when the format of the cached entries changes.
+_DEP_CACHE_FILE = ".depcache.pkl"
+_DEP_CACHE_VERSION = 1
+
+# Windows: do not create a console window for child processes whose output is
+# captured or discarded anyway (0, i.e. no flags, elsewhere).
+_NO_WINDOW = getattr(subprocess, "CREATE_NO_WINDOW", 0)
+
+# Sentinel for "not cached yet", since None is a valid cached value (missing file).
+_MISS = object()
+
+# Echo every executed command when BLDMGR_VERBOSE is set (to anything but '0'),
+# or with the make-style 'V=1'.
+_VERBOSE = os.environ.get("BLDMGR_VERBOSE", "0") not in ("", "0") or os.environ.get("V") == "1"
+
+@functools.lru_cache(maxsize=4096)
+def _obj_path(src_file: str, project_name: str, build_dir: str) -> str:
+    """Maps a source file to its object file; memoized since every build asks for each source several times."""
+    # Sources of the project itself start with '<project>/': slicing that off is
+    # much cheaper than os.path.relpath(), which is only needed for other modules.
+    prefix = project_name + os.sep
+    if src_file.startswith(prefix):
+        relative_src_path = src_file[len(prefix):]
+    else:
+        relative_src_path = os.path.relpath(src_file, project_name)
+    return os.path.join(build_dir, os.path.normpath(relative_src_path) + '.o')
+
+@functools.lru_cache(maxsize=4096)
+def _dep_path(obj_file: str) -> str:
+    """Maps an object file to the dependency file gcc's -MMD writes next to it."""
+    return os.path.splitext(obj_file)[0] + '.d'
+
+def _file_digest(path: str, algorithm: str = "sha1") -> bytes:
+    """Returns the digest of a file's contents (SHA-1 by default)."""
+    with open(path, 'rb') as f:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+, hashes in C.
+            return hashlib.file_digest(f, algorithm).digest()
+        digest = hashlib.new(algorithm)
+        for chunk in iter(lambda: f.read(1 << 16), b''):
+            digest.update(chunk)
+        return digest.digest()
+
+def _quote_response_arg(arg: str) -> str:
+    """Escapes an argument for a gcc response file, where whitespace, quotes, and backslashes are special."""
+    return "".join("\\" + c if c in "\\\"' \t" else c for c in str(arg))
+
+def _ninja_escape_path(path: str) -> str:
+    """Escapes a path for use in a Ninja 'build' statement."""
+    return path.replace('$', '$$').replace(' ', '$ ').replace(':', '$:')
+
+def _ninja_command(cmd: list) -> str:
+    """Joins an argument list into a Ninja 'command' value for the host shell."""
+    if sys.platform == "win32":
+        cmd_str = subprocess.list2cmdline([str(arg) for arg in cmd])
+    else:
+        cmd_str = shlex.join([str(arg) for arg in cmd])
+    return cmd_str.replace('$', '$$')
+
+# ELF constants used by the section and segment readers below.
+_SHT_NOBITS, _SHF_WRITE, _SHF_ALLOC, _SHF_EXECINSTR, _PT_LOAD = 8, 0x1, 0x2, 0x4, 1
+
+def _read_elf_headers(f, elf_path: str) -> tuple:
+    """
+    Reads the section and program header tables of an open ELF32 or ELF64 file
+    of either byte order.
+
+    Returns:
+        tuple: (sections, segments), lists of (sh_type, sh_flags, sh_addr, sh_offset, sh_size)
+               and (p_type, p_offset, p_paddr, p_filesz) tuples.
+
+    Raises:
+        ValueError: If the file is not a valid ELF file.
+    """
+    ident = f.read(16)
+    if ident[:4] != b'\x7fELF' or ident[4] not in (1, 2) or ident[5] not in (1, 2):
+        raise ValueError(f"'{elf_path}' is not an ELF file")
+    order = '<' if ident[5] == 1 else '>'
+    if ident[4] == 1:  # ELF32
+        header, section, segment = '16x12xII6xHHHH', '4xIIIII16x', 'II4xII12x'
+    else:  # ELF64
+        header, section, segment = '16x16xQQ6xHHHH', '4xIQQQQ24x', 'I4xQ8xQQ16x'
+    header, section, segment = order + header, order + section, order + segment
+    f.seek(0)
+    phoff, shoff, phentsize, phnum, shentsize, shnum = struct.unpack(header, f.read(struct.calcsize(header)))
+
+    def read_table(offset, entsize, count, fmt):
+        if not count:
+            return []
+        f.seek(offset)
+        table = f.read(entsize * count)
+        if entsize < struct.calcsize(fmt) or len(table) < entsize * count:
+            raise ValueError(f"'{elf_path}' has a truncated header table")
+        return [struct.unpack_from(fmt, table, i) for i in range(0, entsize * count, entsize)]
+
+    return read_table(shoff, shentsize, shnum, section), read_table(phoff, phentsize, phnum, segment)
+
+def _elf_size(elf_path: str) -> tuple:
+    """
+    Computes the text, data and bss sizes of an ELF file from its section headers,
+    with the same rules as the Berkeley format of GNU 'size': allocated sections
+    that are executable or read-only count as text, other allocated sections with
+    contents as data, and the rest (SHT_NOBITS) as bss.
+
+    Raises:
+        ValueError: If the file is not a valid ELF file.
+    """
+    with open(elf_path, 'rb') as f:
+        sections, _ = _read_elf_headers(f, elf_path)
+    text = data = bss = 0
+    for sh_type, sh_flags, _, _, sh_size in sections:
+        if not sh_flags & _SHF_ALLOC:
+            continue
+        if sh_flags & _SHF_EXECINSTR or not sh_flags & _SHF_WRITE:
+            text += sh_size
+        elif sh_type != _SHT_NOBITS:
+            data += sh_size
+        else:
+            bss += sh_size
+    return text, data, bss
+
+def _elf_to_bin(elf_path: str, bin_path: str):
+    """
+    Writes the raw binary image of an ELF file, as 'objcopy -O binary' does: the
+    contents of every allocated section placed at its load address (LMA), from
+    the lowest to the highest address, with the gaps filled with zeros.
+
+    A section's load address is derived from the PT_LOAD segment that holds it
+    in the file, so initialised data is placed after the code in flash rather
+    than at its RAM address. Sections outside any segment load at their address.
+
+    Raises:
+        ValueError: If the file is not a valid ELF file.
+    """
+    with open(elf_path, 'rb') as f:
+        sections, segments = _read_elf_headers(f, elf_path)
+        loads = [s for s in segments if s[0] == _PT_LOAD and s[3]]
+        placed = []
+        for sh_type, sh_flags, sh_addr, sh_offset, sh_size in sections:
+            if not sh_flags & _SHF_ALLOC or sh_type == _SHT_NOBITS or not sh_size:
+                continue
+            lma = sh_addr
+            for _, p_offset, p_paddr, p_filesz in loads:
+                if p_offset <= sh_offset < p_offset + p_filesz:
+                    lma = p_paddr + sh_offset - p_offset
+                    break
+            placed.append((lma, sh_offset, sh_size))
+
+        image = bytearray()
+        if placed:
+            start = min(lma for lma, _, _ in placed)
+            for lma, sh_offset, sh_size in sorted(placed):
+                offset = lma - start
+                if offset + sh_size > len(image):
+                    image.extend(bytes(offset + sh_size - len(image)))
+                f.seek(sh_offset)
+                image[offset:offset + sh_size] = f.read(sh_size)
+    with open(bin_path, 'wb') as f:
+        f.write(image)
+
 class Builder:
     """
     Encapsulates all logic for building, cleaning, and programming the project.
@@ -103,14 +601,80 @@ class Builder:
         if self.config.TOOLCHAIN_PATH and self.config.TOOLCHAIN_PATH not in os.environ['PATH']:
             os.environ['PATH'] = self.config.TOOLCHAIN_PATH + os.pathsep + os.environ['PATH']
 
-        self.cc = self.config.TOOLCHAIN_PREFIX + "gcc"
-        self.cpp = self.config.TOOLCHAIN_PREFIX + "g++"
-        self.asm = self.config.TOOLCHAIN_PREFIX + "gcc"
+        # Compilers are argument tuples so that a launcher such as ccache can be
+        # placed in front of them. The last element is always the real compiler.
+        self._launcher = None
+        if self.config.USE_CCACHE:
+            self._launcher = shutil.which("ccache") or shutil.which("sccache")
+        launcher = []
+        if self._launcher:
+            print(f"⚡ Using compiler cache: {self._launcher}")
+            launcher = [self._launcher]
+            # Share cache entries between checkouts in different directories,
+            # hash the compiler by content, not mtime, so that re-extracting the
+            # toolchain does not invalidate the cache, and compress the entries.
+            # The firmware does not use __DATE__/__TIME__, and headers freshly
+            # written by a checkout should not make ccache bypass its cache, so
+            # both checks are relaxed.
+            # The compiler subprocesses inherit these from os.environ.
+            os.environ.setdefault("CCACHE_BASEDIR", os.getcwd())
+            os.environ.setdefault("CCACHE_COMPILERCHECK", "content")
+            os.environ.setdefault("CCACHE_COMPRESS", "1")
+            os.environ.setdefault("CCACHE_SLOPPINESS", "time_macros,include_file_mtime")
+
+        # Fan compiles out to the hosts listed in DISTCC_HOSTS. Behind ccache,
+        # distcc only runs on cache misses; sccache cannot wrap it, so distcc
+        # replaces sccache as the launcher.
+        distcc = shutil.which("distcc") if self.config.USE_DISTCC else None
+        if distcc:
+            print(f"🌐 Distributing compiles with distcc: {distcc}")
+            if self._launcher and os.path.basename(self._launcher).lower().startswith("ccache"):
+                os.environ.setdefault("CCACHE_PREFIX", distcc)
+            else:
+                self._launcher = distcc
+                launcher = [distcc]
+
+        # Remote compiles spend most of their time waiting on the network, so
+        # distcc recommends several jobs per remote host.
+        if self.config.BUILD_JOBS:
+            self.build_jobs = self.config.BUILD_JOBS
+        elif distcc:
+            self.build_jobs = int(os.environ.get("DISTCC_HOSTS_COUNT", os.cpu_count())) * 4
+        else:
+            self.build_jobs = os.cpu_count()
+
+        self.cc = (*launcher, self.config.TOOLCHAIN_PREFIX + "gcc")
+        self.cpp = (*launcher, self.config.TOOLCHAIN_PREFIX + "g++")
+        self.asm = (*launcher, self.config.TOOLCHAIN_PREFIX + "gcc")
         self.cp = self.config.TOOLCHAIN_PREFIX + "objcopy"
         self.sz = self.config.TOOLCHAIN_PREFIX + "size"
 
-        self._collect_sources_and_includes()
-        self._construct_flags()
+        # Let Ninja schedule the build when it is installed; otherwise fall back
+        # to the built-in incremental engine.
+        self.use_ninja = bool(self.config.USE_NINJA) and shutil.which("ninja") is not None
+
+        # On Windows, CreateProcess limits a command line to 32767 characters and
+        # every compile repeats the full flag list; pass the shared flags through
+        # gcc '@file' response files instead.
+        self.use_response_files = sys.platform == "win32"
+
+        # Memoized modification times (None for missing files), shared by all
+        # up-to-date checks of one build. Sources typically share most of their
+        # headers, so each path only needs to be stat'ed once.
+        self._stat_cache = {}
+        # Parsed .d files: {dep_file: (mtime, dependencies)}, loaded from the
+        # previous build so unchanged .d files are not read again.
+        self._dep_cache = self._load_dep_cache()
+        self._dep_cache_dirty = False
+        # File digests for content signatures: {path: (mtime, digest)}. A header
+        # shared by many sources is hashed once rather than once per source.
+        self._digest_cache = {}
+        # Arguments behind each '@file' written by _write_response_file().
+        self._response_args = {}
+
+        # Sources and flags are only needed to compile or link; commands such as
+        # 'clean' and 'program' never touch them. See _prepare_build().
+        self._prepared = False
 
     def _ensure_tools_are_present(self):
         """Checks for required toolchains and downloads them if missing."""
@@ -121,9 +685,13 @@ class Builder:
         # Using a specific version (v14.2.0-3) ensures a consistent build environment.
         if not os.path.isdir(self.config.TOOLCHAIN_PATH):
             print("⚠️  RISC-V GCC toolchain not found. Attempting to download and set up...")
-            url = "https://github.com/xpack-dev-tools/riscv-none-elf-gcc-xpack/releases/download/v14.2.0-3/xpack-riscv-none-elf-gcc-14.2.0-3-win32-x64.zip"
-            archive_path = os.path.join(tools_dir, "gcc.zip")
-            _download_and_extract_tool(url=url, archive_path=archive_path, extract_dir=tools_dir, final_check_path=self.config.TOOLCHAIN_PATH)
+            # A tarball is extracted while it downloads, so it is preferred over
+            # the .zip archive when the release provides one.
+            base_url = "https://github.com/xpack-dev-tools/riscv-none-elf-gcc-xpack/releases/download/v14.2.0-3/xpack-riscv-none-elf-gcc-14.2.0-3-win32-x64"
+            archive_path = os.path.join(tools_dir, "gcc.tar.gz")
+            _download_and_extract_tool(url=base_url + ".tar.gz", archive_path=archive_path, extract_dir=tools_dir,
+                                       final_check_path=self.config.TOOLCHAIN_PATH, fallback_url=base_url + ".zip",
+                                       checksums=self.config.TOOL_SHA256)
 
         # 2. Check for OpenOCD.
         # Using a specific version (v0.12.0) ensures compatibility with the target and debugger.
@@ -135,38 +703,95 @@ class Builder:
             extracted_folder_name = 'openocd-0.12.0'
             final_folder_name = os.path.basename(os.path.dirname(os.path.dirname(self.config.OPENOCD_PATH)))
             rename_map = {extracted_folder_name: final_folder_name}
-            _download_and_extract_tool(url=url, archive_path=archive_path, extract_dir=tools_dir, final_check_path=self.config.OPENOCD_PATH, rename_map=rename_map)
+            _download_and_extract_tool(url=url, archive_path=archive_path, extract_dir=tools_dir, final_check_path=self.config.OPENOCD_PATH, rename_map=rename_map,
+                                       checksums=self.config.TOOL_SHA256)
+
+    def _prepare_build(self):
+        """Collects sources and constructs the build flags on first use."""
+        if self._prepared:
+            return
+        self._collect_sources_and_includes()
+        self._construct_flags()
+        self._prepared = True
 
     def _collect_sources_and_includes(self):
         """Iterates through components in config.py and collects all active source files and include paths."""
-        self.c_sources = []
-        self.cpp_sources = []
-        self.asm_sources = []
-        self.include_paths = []
-
         print("🔎 Analyzing project components...")
+        enabled = []
         for name, component in self.config.COMPONENTS.items():
             if component.get("enabled", False):
                 print(f"  - Enabling component: {name}")
-                module = component.get("module", self.project_name)
-
-                # Prepend the project directory to all relative paths from the config
-                self.c_sources.extend([os.path.join(module, p) for p in component.get("c_sources", [])])
-                self.cpp_sources.extend([os.path.join(module, p) for p in component.get("cpp_sources", [])])
-                self.asm_sources.extend([os.path.join(module, p) for p in component.get("asm_sources", [])])
-
-                for inc_path in component.get("include_paths", []):
-                    if inc_path.startswith("-I"):
-                        # Reconstruct the include flag with the project path
-                        path = inc_path[2:]                        
-                        self.include_paths.append(f"-I{os.path.join(module, path)}")
-                    else: # Fallback for paths not prefixed with -I, though current format uses it.
-                        self.include_paths.append(f"-I{os.path.join(module, inc_path)}")
+                enabled.append((component.get("module", self.project_name), component))
             else:
                 print(f"  - Disabling component: {name}")
-        
+
+        def collect(key):
+            # Prepend the component's module directory to all relative paths from the config.
+            return chain.from_iterable(
+                (os.path.join(module, p) for p in component.get(key, ())) for module, component in enabled
+            )
+
+        # The source lists are only read from here on, so they are frozen to tuples.
+        self.c_sources = tuple(collect("c_sources"))
+        self.cpp_sources = tuple(collect("cpp_sources"))
+        self.asm_sources = tuple(collect("asm_sources"))
+        if self.config.UNITY_BUILD:
+            self.c_sources = tuple(self._write_unity_sources(self.c_sources))
+        # Map every source to its object file once; the compile and Ninja steps
+        # look the paths up here.
+        self.obj_paths = {src: self._get_obj_path(src) for src in self.c_sources + self.cpp_sources + self.asm_sources}
+
         self.is_cpp_project = bool(self.cpp_sources)
-        self.include_paths = sorted(list(set(self.include_paths)))
+        # Strip the '-I' prefix (the format used by the configs) and make the path
+        # relative to the project root. Normalize once so that spellings like 'src'
+        # and 'src/' collapse into a single path; dict.fromkeys() removes duplicates
+        # while keeping the search order given in the config.
+        include_dirs = (
+            os.path.join(module, inc[2:] if inc.startswith("-I") else inc)
+            for module, component in enabled for inc in component.get("include_paths", ())
+        )
+        self.include_paths = tuple(dict.fromkeys(os.path.normpath(p).replace("\\", "/") for p in include_dirs))
+        # The '-I' arguments shared by all compile steps, formatted once.
+        self._inc_args = tuple(f"-I{p}" for p in self.include_paths)
+
+    def _write_unity_sources(self, c_sources):
+        """
+        Combines the C sources into 'unity' translation units of UNITY_BATCH_SIZE
+        files each, written to the 'unity' directory of the build directory as
+        'unity_N.c' files that '#include' the real sources. Headers shared by the
+        sources of a unit are then parsed once per unit instead of once per file.
+
+        Sources listed in NO_UNITY (paths relative to the repository root) are
+        compiled on their own. A unit is only rewritten when its contents change,
+        so its object stays up-to-date until one of its sources does.
+
+        Returns:
+            list: The unity sources followed by the excluded sources.
+        """
+        excluded = {os.path.normpath(p) for p in self.config.NO_UNITY}
+        combined = [src for src in c_sources if os.path.normpath(src) not in excluded]
+        separate = [src for src in c_sources if os.path.normpath(src) in excluded]
+
+        unity_dir = os.path.join(self.build_dir, "unity")
+        os.makedirs(unity_dir, exist_ok=True)
+        batch_size = max(self.config.UNITY_BATCH_SIZE, 1)
+        unity_sources = []
+        for i in range(0, len(combined), batch_size):
+            path = os.path.join(unity_dir, f"unity_{i // batch_size}.c")
+            content = "/* Generated by bldmgr/build_logic.py. Do not edit. */\n" + "".join(
+                f'#include "{os.path.relpath(src, unity_dir).replace(os.sep, "/")}"\n'
+                for src in combined[i:i + batch_size]
+            )
+            try:
+                with open(path, 'r') as f:
+                    unchanged = f.read() == content
+            except OSError:
+                unchanged = False
+            if not unchanged:
+                with open(path, 'w') as f:
+                    f.write(content)
+            unity_sources.append(path)
+        return unity_sources + separate
 
     def _construct_flags(self):
         """Builds the final lists of CFLAGS, ASFLAGS, CPPFLAGS, and LDFLAGS."""
@@ -177,19 +802,23 @@ class Builder:
             "-ffunction-sections", # Place each function in its own section.
             "-fdata-sections"
         ] + self.config.COMMON_WARNING_FLAGS + self.config.GLOBAL_C_DEFINES
+        if self.config.ENABLE_LTO:
+            # Fat objects keep regular code next to the LTO bytecode, so they can
+            # still be linked (or inspected) without the linker plugin.
+            base_flags += ["-flto=auto", "-ffat-lto-objects"]
 
         # C Flags
-        self.cflags = base_flags + [self.config.C_STANDARD] + self.config.C_WARNING_FLAGS + self.include_paths + ["-MMD", "-MP"]
+        self.cflags = base_flags + [self.config.C_STANDARD] + self.config.C_WARNING_FLAGS + list(self._inc_args) + ["-MMD", "-MP"]
         if self.config.DEBUG_MODE:
             self.cflags.extend(["-g", "-gdwarf-2"])
 
         # C++ Flags
-        self.cppflags = base_flags + [self.config.CPP_STANDARD] + self.config.CPP_WARNING_FLAGS + self.config.CPP_EMBEDDED_FLAGS + self.include_paths + ["-MMD", "-MP"]
+        self.cppflags = base_flags + [self.config.CPP_STANDARD] + self.config.CPP_WARNING_FLAGS + self.config.CPP_EMBEDDED_FLAGS + list(self._inc_args) + ["-MMD", "-MP"]
         if self.config.DEBUG_MODE:
             self.cppflags.extend(["-g", "-gdwarf-2"])
 
         # Assembler Flags (Definitions are also needed here for C preprocessor directives in .S files)
-        self.asflags = self.config.CPU_FLAGS + [self.config.OPTIMIZATION] + self.include_paths + self.config.GLOBAL_C_DEFINES
+        self.asflags = ["-x", "assembler-with-cpp"] + self.config.CPU_FLAGS + [self.config.OPTIMIZATION] + list(self._inc_args) + self.config.GLOBAL_C_DEFINES
 
         # Linker Flags
         linker_script_path = self.config.LINKER_SCRIPT
@@ -203,25 +832,128 @@ class Builder:
         
         if self.is_cpp_project:
             self.ldflags.append("-lstdc++")
+        if self.config.ENABLE_LTO:
+            # '-flto=auto' runs the link-time code generation on all cores.
+            self.ldflags.extend(["-flto=auto", "-fuse-linker-plugin"])
+
+        # Freeze the flags: they are shared, read-only, by every command of the build.
+        self.cflags = tuple(self.cflags)
+        self.cppflags = tuple(self.cppflags)
+        self.asflags = tuple(self.asflags)
+        self.ldflags = tuple(self.ldflags)
+
+        # Compiler and flags for each kind of source, see _source_kind().
+        self.toolchain = {
+            "cc": (self.cc, self.cflags),
+            "cxx": (self.cpp, self.cppflags),
+            "as": (self.asm, self.asflags),
+        }
+
+    @staticmethod
+    def _format_command(cmd):
+        """Formats a command for display, quoted so it can be pasted into a shell, using forward slashes for readability."""
+        return shlex.join(map(str, cmd)).replace('\\', '/')
 
     @staticmethod
     def run_command(cmd):
-        """Executes a shell command, prints it, and exits on failure."""
-        cmd_str = ' '.join([str(arg).replace('\\', '/') for arg in cmd])
-        print(f"🚀 Executing: {cmd_str}")
+        """
+        Executes a command (an argument list, never through a shell), prints it in
+        verbose mode, and exits on failure.
+
+        No shell and no preexec_fn are involved, which lets CPython 3.10+ on Linux
+        start the process with vfork instead of fork, avoiding a copy of the page
+        tables of the Python process on every spawn.
+        """
+        if _VERBOSE:
+            print(f"🚀 Executing: {Builder._format_command(cmd)}")
         try:
-            subprocess.run(cmd, check=True, shell=isinstance(cmd, str))
+            subprocess.run(cmd, check=True, close_fds=True, stdin=subprocess.DEVNULL)
         except (subprocess.CalledProcessError, FileNotFoundError) as e:
             print(f"❌ Error: Command failed: {e}", file=sys.stderr)
             sys.exit(1)
 
+    @staticmethod
+    def run_command_parallel(cmd, cwd=None):
+        """
+        Executes a command whose output must not interleave with other jobs,
+        optionally in another working directory.
+
+        stdout and stderr are merged into a single pipe, which keeps gcc's
+        diagnostics in order and holds only what the compiler actually printed.
+        The caller prints the output once the return code is known.
+
+        Returns:
+            tuple: (returncode, output) where output is the decoded text.
+        """
+        with subprocess.Popen(cmd, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, bufsize=65536, cwd=cwd, close_fds=True,
+                              creationflags=_NO_WINDOW) as proc:
+            output = proc.stdout.read()
+            returncode = proc.wait()
+        return returncode, output.decode(errors="replace")
+
     def clean(self):
-        """Removes the build directory to ensure a fresh build."""
+        """
+        Removes the build directory to ensure a fresh build.
+
+        A missing or empty directory is handled without starting any process.
+        Otherwise the native tool ('rmdir /S /Q' on Windows, 'rm -rf' elsewhere)
+        is tried first, as it is considerably faster than a serial
+        shutil.rmtree(). If it is unavailable or fails, files are unlinked
+        concurrently and the emptied directories are then removed bottom-up.
+        """
         print(f"🧹 Cleaning build directory: {self.build_dir}")
         if os.path.isdir(self.build_dir):
-            shutil.rmtree(self.build_dir)
+            with os.scandir(self.build_dir) as entries:
+                is_empty = next(entries, None) is None
+            if is_empty:
+                # Nothing to delete; no need to start a process for it.
+                os.rmdir(self.build_dir)
+            else:
+                self._remove_build_dir()
+        self._stat_cache.clear()
+        self._dep_cache.clear()
+        self._digest_cache.clear()
         print("Clean complete.")
 
+    def _remove_build_dir(self):
+        """Removes the non-empty build directory, using the native tool if possible."""
+        # On Windows, per-file deletes are slow, not least because each one can
+        # be intercepted by the virus scanner; 'rmdir /S /Q' avoids that.
+        path = os.path.normpath(self.build_dir)
+        if sys.platform == "win32":
+            cmd = ["cmd", "/c", "rmdir", "/S", "/Q", path]
+        else:
+            cmd = ["rm", "-rf", "--", path]
+        try:
+            subprocess.run(cmd, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, close_fds=True,
+                           creationflags=_NO_WINDOW)
+        except OSError:
+            pass
+        if os.path.isdir(self.build_dir):
+            self._remove_tree(self.build_dir)
+
+    @staticmethod
+    def _remove_tree(path):
+        """Removes a directory tree, unlinking its files concurrently on a thread pool."""
+        files, dirs = [], []
+        for root, subdirs, filenames in os.walk(path, topdown=False):
+            files.extend(os.path.join(root, f) for f in filenames)
+            # Links to directories are listed as directories but must be unlinked.
+            files.extend(os.path.join(root, d) for d in subdirs if os.path.islink(os.path.join(root, d)))
+            dirs.append(root)
+        with ThreadPoolExecutor(max_workers=32) as executor:
+            list(executor.map(os.unlink, files))
+        for d in dirs:
+            os.rmdir(d)
+
+    def _source_kind(self, src_file):
+        """Returns the compile step ('cc', 'cxx' or 'as') for a source file, based on its extension."""
+        kind = _SOURCE_KINDS.get(os.path.splitext(src_file)[1])
+        if kind is None:
+            print(f"❌ Error: Unsupported source file type: '{src_file}'", file=sys.stderr)
+            sys.exit(1)
+        return kind
+
     def _get_obj_path(self, src_file):
         """
         Generates the path for an object file inside the project's build directory,
@@ -232,110 +964,657 @@ class Builder:
             - build_dir: "build/prj_usb_serial"
             - Returns: "build/prj_usb_serial/src/main.c.o"
         """
-        relative_src_path = os.path.relpath(src_file, self.project_name)
-        return os.path.join(self.build_dir, os.path.normpath(relative_src_path) + '.o')
+        if src_file.startswith(self.build_dir + os.sep):
+            # Generated sources (unity units) already live in the build directory.
+            return src_file + '.o'
+        return _obj_path(src_file, self.project_name, self.build_dir)
+
+    @staticmethod
+    def _get_dep_path(obj_file):
+        """Returns the path of the dependency file gcc's -MMD writes next to an object file."""
+        return _dep_path(obj_file)
 
     def _parse_dependencies(self, dep_file):
         """
-        Parses a GCC-generated dependency file (.d) to extract all header dependencies.
+        Parses a GCC-generated dependency file (.d) to extract all dependencies.
         This is used for incremental build checks.
+
+        The file is in Makefile syntax: 'target: dep1 dep2 \\' with backslash line
+        continuations, followed by the empty phony rules that '-MP' adds for each
+        header. Only the first rule carries the dependency list.
+        The file is scanned as bytes in a single pass: no text decoding of the
+        whole file and no regular expressions, only the paths are decoded. All
+        dependencies are kept, whatever their extension ('.h', '.hpp', '.inc', ...).
+
+        Results are memoized by path and modification time, since the up-to-date
+        check and the content signature both need the list of the same file.
         """
-        if not os.path.exists(dep_file):
+        mtime = self._mtime(dep_file)
+        if mtime is None:
+            return []
+        cached = self._dep_cache.get(dep_file)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        try:
+            f = open(dep_file, 'rb')
+        except OSError:
             return []
-        with open(dep_file, 'r') as f:
-            content = f.read()
-        return re.findall(r'([^\s\\]+\.(?:h|inc))', content)
+        with f:
+            data = f.read()
+        # A rule ends at the first newline that is not escaped with a backslash.
+        rule = data.replace(b'\\\r\n', b' ').replace(b'\\\n', b' ').split(b'\n', 1)[0]
+        # Split at ': ' rather than ':' so Windows drive letters are kept intact.
+        _, _, deps = rule.partition(b': ')
+        # os.fsdecode() round-trips paths that are not valid UTF-8 (surrogateescape),
+        # so they can still be stat'ed.
+        deps = [os.fsdecode(dep) for dep in deps.split()]
+        self._dep_cache[dep_file] = (mtime, deps)
+        self._dep_cache_dirty = True
+        return deps
 
-    def _is_rebuild_needed(self, src_file, obj_file):
+    def _load_dep_cache(self):
+        """Returns the parsed .d files saved by the previous build, or an empty cache."""
+        try:
+            with open(os.path.join(self.build_dir, _DEP_CACHE_FILE), 'rb') as f:
+                version, cache = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError):
+            return {}
+        return cache if version == _DEP_CACHE_VERSION else {}
+
+    def _save_dep_cache(self, object_files):
         """
-        Checks if a source file needs to be recompiled.
-        A rebuild is needed if:
+        Saves the parsed .d files of the current objects for the next build. The
+        file is replaced atomically, so an interrupted build cannot corrupt it.
+        """
+        if not self._dep_cache_dirty:
+            return
+        current = {self._get_dep_path(obj) for obj in object_files}
+        cache = {dep_file: entry for dep_file, entry in self._dep_cache.items() if dep_file in current}
+        path = os.path.join(self.build_dir, _DEP_CACHE_FILE)
+        with open(path + ".tmp", 'wb') as f:
+            pickle.dump((_DEP_CACHE_VERSION, cache), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(path + ".tmp", path)
+        self._dep_cache_dirty = False
+
+    def _mtime(self, path):
+        """
+        Returns the modification time of a path in integer nanoseconds, or None if
+        it does not exist, using a single cached os.stat (which also follows
+        symlinked headers to their target).
+        """
+        mtime = self._stat_cache.get(path, _MISS)
+        if mtime is _MISS:
+            try:
+                mtime = os.stat(path).st_mtime_ns
+            except (FileNotFoundError, NotADirectoryError):
+                mtime = None
+            self._stat_cache[path] = mtime
+        return mtime
+
+    def _snapshot_include_dirs(self):
+        """
+        Seeds the stat cache with the modification times of the files in every
+        include directory, read with one os.scandir() per directory.
+
+        On Windows the directory listing already carries each file's timestamps,
+        so the headers of a whole directory cost a single call instead of one
+        stat per header. (On other systems DirEntry.stat() is a full stat call,
+        so this is not used there.) Files in subdirectories, included as
+        "sub/header.h", are still stat'ed on demand.
+        """
+        for inc in self.include_paths:
+            try:
+                with os.scandir(inc) as entries:
+                    for entry in entries:
+                        if entry.is_file():
+                            self._stat_cache.setdefault(f"{inc}/{entry.name}", entry.stat().st_mtime_ns)
+            except OSError:
+                continue
+
+    def _is_outdated(self, src_file, obj_file, notes):
+        """
+        Checks the timestamps of an object file against its inputs.
+        The object is outdated if:
         1. The object file does not exist.
         2. The source file is newer than the object file.
         3. Any of its header dependencies are newer than the object file.
+        Messages for the build log are appended to 'notes'.
         """
-        if not os.path.exists(obj_file):
+        obj_mtime = self._mtime(obj_file)
+        if obj_mtime is None:
             return True
 
-        obj_mtime = os.path.getmtime(obj_file)
-        if os.path.getmtime(src_file) > obj_mtime:
+        src_mtime = self._mtime(src_file)
+        if src_mtime is None or src_mtime > obj_mtime:
             return True
 
         # For C/C++ files, check their header dependencies.
-        if src_file.endswith((".c", ".cpp", ".cc", ".cxx")):
-            dep_file = obj_file.replace('.o', '.d')
-            if not os.path.exists(dep_file):
+        if self._source_kind(src_file) != "as":
+            dep_file = self._get_dep_path(obj_file)
+            if self._mtime(dep_file) is None:
                 return True
 
             dependencies = self._parse_dependencies(dep_file)
             for dep in dependencies:
-                if os.path.exists(dep) and os.path.getmtime(dep) > obj_mtime:
-                    print(f"    -> Dependency '{dep}' changed.")
+                dep_mtime = self._mtime(dep)
+                if dep_mtime is not None and dep_mtime > obj_mtime:
+                    notes.append(f"Dependency '{dep}' changed.")
                     return True
         return False
 
+    def _compute_signature(self, cmd, src_file, obj_file):
+        """
+        Computes a content signature for an object file: a SHA-1 over the compile
+        command and the contents of the source and every dependency listed in its
+        .d file. Returns None if any input cannot be read.
+        """
+        signature = hashlib.sha1(repr(cmd).encode())
+        inputs = self._parse_dependencies(self._get_dep_path(obj_file)) or [src_file]
+        # Flags passed through response files are part of the command too.
+        inputs = [arg[1:] for arg in cmd if arg.startswith("@")] + inputs
+        try:
+            for path in inputs:
+                signature.update(path.encode())
+                signature.update(self._content_digest(path))
+        except OSError:
+            return None
+        return signature.hexdigest()
+
+    def _content_digest(self, path):
+        """Returns the digest of a file's contents, memoized by modification time."""
+        mtime = self._mtime(path)
+        cached = self._digest_cache.get(path)
+        if cached is not None and cached[0] == mtime and mtime is not None:
+            return cached[1]
+        digest = _file_digest(path)
+        self._digest_cache[path] = (mtime, digest)
+        return digest
+
+    def _is_rebuild_needed(self, src_file, obj_file, cmd, notes):
+        """
+        Checks if a source file needs to be recompiled.
+
+        An object is always rebuilt when its compile command differs from the one
+        recorded in its '.cmdhash' file. Otherwise timestamps are checked first
+        since they are cheap. If they report the object as outdated, the content
+        signature recorded at the last compile is compared as well, so a touch or
+        a checkout that restores identical content does not cause a recompile.
+
+        Only touches files belonging to this object, so checks for different
+        sources can run concurrently. Messages for the build log are appended to
+        'notes' rather than printed, to keep the log in source order.
+        """
+        if self._mtime(obj_file) is None:
+            return True
+
+        # Timestamps cannot tell that the flags changed, e.g. after editing
+        # OPTIMIZATION in config.py; compare the hash of the compile command.
+        try:
+            with open(obj_file + ".cmdhash", 'r') as f:
+                stored_hash = f.read().strip()
+        except OSError:
+            stored_hash = None
+        if stored_hash != self._command_hash(cmd):
+            notes.append("Compile command changed.")
+            return True
+
+        if not self._is_outdated(src_file, obj_file, notes):
+            return False
+
+        try:
+            with open(obj_file + ".sig", 'r') as f:
+                stored_signature = f.read().strip()
+        except OSError:
+            return True
+        if stored_signature != self._compute_signature(cmd, src_file, obj_file):
+            return True
+
+        # Contents are unchanged: refresh the object's timestamp so the cheap
+        # check succeeds on the next build.
+        notes.append("Contents unchanged.")
+        os.utime(obj_file)
+        self._stat_cache.pop(obj_file, None)
+        return False
+
+    def _command_hash(self, cmd):
+        """
+        Hashes a compile command, with '@file' arguments replaced by the
+        arguments written to the response file, so flag changes are detected
+        whether or not response files are used.
+        """
+        args = [a for arg in cmd for a in self._response_args.get(arg, (arg,))]
+        return hashlib.blake2b(repr(args).encode(), digest_size=16).hexdigest()
+
+    def _write_signature(self, cmd, src_file, obj_file):
+        """Records the command hash and content signature of a freshly compiled object file."""
+        with open(obj_file + ".cmdhash", 'w') as f:
+            f.write(self._command_hash(cmd))
+        signature = self._compute_signature(cmd, src_file, obj_file)
+        if signature:
+            with open(obj_file + ".sig", 'w') as f:
+                f.write(signature)
+
+    def _write_response_file(self, name, args):
+        """
+        Writes arguments, one per line, to a gcc response file in the build directory.
+        The file is only rewritten when its contents change.
+
+        Returns:
+            str: The '@file' argument that makes gcc read the file.
+        """
+        path = os.path.join(self.build_dir, name)
+        self._response_args[f"@{path}"] = tuple(args)
+        content = "".join(f"{_quote_response_arg(arg)}\n" for arg in args)
+        try:
+            with open(path, 'r') as f:
+                if f.read() == content:
+                    return f"@{path}"
+        except OSError:
+            pass
+        os.makedirs(self.build_dir, exist_ok=True)
+        with open(path, 'w') as f:
+            f.write(content)
+        return f"@{path}"
+
+    def _run_compile_jobs(self, jobs):
+        """
+        Runs compile commands concurrently on a thread pool of 'build_jobs' workers
+        (one per CPU core unless BUILD_JOBS is set or distcc is used).
+
+        Threads are sufficient because each job spends its time blocked on a
+        compiler subprocess. The output of every job is captured and printed as a
+        single block, so diagnostics from different sources never interleave.
+        The first failing command cancels all pending jobs and aborts the build.
+
+        Args:
+            jobs (list): A list of (cmd, members, cwd) tuples to execute, where
+                         members lists the (cmd, src, obj_path) compiles that cmd
+                         performs. A batched command (see _batch_jobs) runs in the
+                         directory cwd; otherwise cwd is None.
+        """
+        print_lock = threading.Lock()
+
+        def compile_one(cmd, members, cwd):
+            started = time.time_ns()
+            returncode, output = self.run_command_parallel(cmd, cwd)
+            with print_lock:
+                for _, src, _ in members:
+                    print(f"  - Compiling '{src}'...")
+                if _VERBOSE:
+                    print(f"🚀 Executing: {self._format_command(cmd)}")
+                if output:
+                    print(output, end="")
+            if returncode != 0:
+                raise subprocess.CalledProcessError(returncode, cmd)
+            for member_cmd, src, obj_path in members:
+                if cwd:
+                    # gcc names the outputs of a multi-file compile after each
+                    # source and writes them to the working directory.
+                    stem = os.path.splitext(os.path.basename(src))[0]
+                    os.replace(os.path.join(cwd, stem + ".o"), obj_path)
+                    try:
+                        os.replace(os.path.join(cwd, stem + ".d"), self._get_dep_path(obj_path))
+                    except FileNotFoundError:
+                        pass
+                # Stamp the object with the time the compile started, so a source
+                # edited while the compiler was running is newer than its object
+                # and gets rebuilt on the next run.
+                os.utime(obj_path, ns=(started, started))
+                # The compile rewrote the object and its .d file.
+                self._stat_cache.pop(obj_path, None)
+                self._stat_cache.pop(self._get_dep_path(obj_path), None)
+                self._write_signature(member_cmd, src, obj_path)
+            if cwd:
+                # Leftovers only cost disk space; never fail the build over them.
+                shutil.rmtree(cwd, ignore_errors=True)
+
+        with ThreadPoolExecutor(max_workers=self.build_jobs) as executor:
+            futures = [executor.submit(compile_one, *job) for job in jobs]
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except (subprocess.CalledProcessError, FileNotFoundError) as e:
+                    executor.shutdown(wait=True, cancel_futures=True)
+                    print(f"❌ Error: Command failed: {e}", file=sys.stderr)
+                    sys.exit(1)
+
+    def _batch_jobs(self, jobs):
+        """
+        Groups compile jobs into multi-file gcc invocations ('gcc -c a.c b.c ...')
+        of up to COMPILE_BATCH_SIZE sources, saving the compiler start-up cost of
+        every file after the first. With COMPILE_BATCH_SIZE = "auto", the sources
+        are spread evenly over the parallel build jobs.
+
+        A batch holds sources of one kind with distinct file names, since gcc
+        names the objects after the sources and writes them to the working
+        directory. Each batch therefore runs in its own directory below the build
+        directory, with the source and '-I' paths made absolute.
+
+        Returns:
+            list: (cmd, members, cwd) tuples for _run_compile_jobs().
+        """
+        batch_size = self.config.COMPILE_BATCH_SIZE
+        if batch_size == "auto":
+            batch_size = -(-len(jobs) // self.build_jobs)
+        batches = {}
+        for job in jobs:
+            src = job[1]
+            stem = os.path.splitext(os.path.basename(src))[0]
+            kind_batches = batches.setdefault(self._source_kind(src), [])
+            for batch in kind_batches:
+                if len(batch) < batch_size and all(stem != s for s, _ in batch):
+                    batch.append((stem, job))
+                    break
+            else:
+                kind_batches.append([(stem, job)])
+
+        def absolute(arg):
+            if arg.startswith("-I") and not os.path.isabs(arg[2:]):
+                return "-I" + os.path.abspath(arg[2:])
+            return arg
+
+        tasks = []
+        for kind, kind_batches in batches.items():
+            compiler, flags = self.toolchain[kind]
+            flags = tuple(absolute(arg) for arg in flags)
+            if self.use_response_files:
+                rsp = self._write_response_file(f"{kind}.batch.rsp", flags)
+                flags = ("@" + os.path.abspath(rsp[1:]),)
+            for i, batch in enumerate(kind_batches):
+                members = [job for _, job in batch]
+                if len(members) == 1:
+                    tasks.append((members[0][0], members, None))
+                    continue
+                cwd = os.path.join(self.build_dir, "batch", f"{kind}{i}")
+                # A failed batch of an earlier build may have left its outputs here.
+                shutil.rmtree(cwd, ignore_errors=True)
+                os.makedirs(cwd, exist_ok=True)
+                sources = tuple(os.path.abspath(src) for _, src, _ in members)
+                if self.use_response_files:
+                    # A long list of absolute source paths could overflow the
+                    # command line as well.
+                    rsp = self._write_response_file(os.path.join("batch", f"{kind}{i}.rsp"), sources)
+                    sources = ("@" + os.path.abspath(rsp[1:]),)
+                cmd = (*compiler, *flags, "-c", *sources)
+                tasks.append((cmd, members, cwd))
+        return tasks
+
     def compile_sources(self):
         """Compiles all C, C++, and Assembly sources into object files, skipping unchanged files."""
+        self._prepare_build()
         print("⚙️  Compiling sources...")
         object_files = []
-        cpp_extensions = (".cpp", ".cc", ".cxx")
+        jobs = []
 
-        all_sources = self.c_sources + self.cpp_sources + self.asm_sources
-        for src in all_sources:
-            obj_path = self._get_obj_path(src)
+        toolchain = self.toolchain
+        if self.use_response_files:
+            toolchain = {
+                kind: (compiler, (self._write_response_file(f"{kind}.rsp", flags),))
+                for kind, (compiler, flags) in toolchain.items()
+            }
+        # The command prefix of each compile step is built once per build; each
+        # source only appends its own input and output paths.
+        prefixes = {kind: (*compiler, *flags, "-c") for kind, (compiler, flags) in toolchain.items()}
+
+        if sys.platform == "win32":
+            self._snapshot_include_dirs()
+
+        candidates = []
+        for src in self.c_sources + self.cpp_sources + self.asm_sources:
+            obj_path = self.obj_paths[src]
             object_files.append(obj_path)
+            cmd = prefixes[self._source_kind(src)] + (src, "-o", obj_path)
+            candidates.append((cmd, src, obj_path))
 
-            print(f"  - Checking '{src}'...")
-            if not self._is_rebuild_needed(src, obj_path):
-                print("    -> Up-to-date. Skipping.")
-                continue
+        def check(job):
+            notes = []
+            cmd, src, obj_path = job
+            return self._is_rebuild_needed(src, obj_path, cmd, notes), notes
 
-            print(f"    -> Compiling...")
-            os.makedirs(os.path.dirname(obj_path), exist_ok=True)
+        # The up-to-date check is pure file I/O (stat calls and small reads), so
+        # it runs on a thread pool to overlap disk latency. The results are
+        # reported in source order; the selected compile commands are then
+        # dispatched in parallel.
+        with ThreadPoolExecutor(max_workers=32) as executor:
+            results = executor.map(check, candidates)
+            for job, (needed, notes) in zip(candidates, results):
+                print(f"  - Checking '{job[1]}'...")
+                for note in notes:
+                    print(f"    -> {note}")
+                if not needed:
+                    print("    -> Up-to-date. Skipping.")
+                    continue
+                print("    -> Queued for compilation.")
+                jobs.append(job)
 
-            if src.endswith(".c"):
-                cmd = [self.cc] + self.cflags + ["-c", src, "-o", obj_path]
-            elif src.endswith(cpp_extensions):
-                cmd = [self.cpp] + self.cppflags + ["-c", src, "-o", obj_path]
-            else: # Assumes .S
-                cmd = [self.asm, "-x", "assembler-with-cpp"] + self.asflags + ["-c", src, "-o", obj_path]
-            
-            self.run_command(cmd)
+        if jobs:
+            # Create each output directory once, rather than once per source.
+            for obj_dir in {os.path.dirname(obj_path) for _, _, obj_path in jobs}:
+                os.makedirs(obj_dir, exist_ok=True)
+            batch_size = self.config.COMPILE_BATCH_SIZE
+            if batch_size == "auto" or (batch_size or 0) > 1:
+                tasks = self._batch_jobs(jobs)
+            else:
+                tasks = [(cmd, [(cmd, src, obj_path)], None) for cmd, src, obj_path in jobs]
+            self._run_compile_jobs(tasks)
 
+        self._save_dep_cache(object_files)
         return object_files
 
     def link_objects(self, object_files):
         """Links all compiled object files into a single .elf executable."""
-        linker = self.cpp if self.is_cpp_project else self.cc
+        self._prepare_build()
+        # Link with the bare compiler driver; compiler caches cannot cache link steps.
+        linker = (self.cpp if self.is_cpp_project else self.cc)[-1]
         print(f"🔗 Linking objects (using {os.path.basename(linker)})...")
         
         elf_path = os.path.join(self.build_dir, f"{self.config.TARGET_NAME}.elf")
-        cmd = [linker] + self.ldflags + object_files + ["-o", elf_path]
-        self.run_command(cmd)
+        objects = object_files
+        if self.use_response_files:
+            # The object list alone can exceed the Windows command-line limit.
+            objects = [self._write_response_file("link.rsp", object_files)]
+        cmd = [linker, *self.ldflags, *objects, "-o", elf_path]
+        # Relink only if the link command (flags or object list) has changed or
+        # an input is newer than the .elf and its contents differ from the last link.
+        cmd_hash = self._command_hash(cmd)
+        inputs = (*object_files, self.config.LINKER_SCRIPT)
+        elf_mtime = self._mtime(elf_path)
+        if elf_mtime is not None:
+            try:
+                with open(elf_path + ".cmdhash", 'r') as f:
+                    stored = f.read().split()
+            except OSError:
+                stored = []
+            if stored[:1] == [cmd_hash]:
+                if all((self._mtime(path) or 0) <= elf_mtime for path in inputs):
+                    print("    -> Up-to-date. Skipping.")
+                    return elf_path
+                if stored[1:] == [self._link_inputs_digest(inputs)]:
+                    # Objects are only touched when their contents are unchanged.
+                    # Refresh the .elf and the binaries made from it, so the cheap
+                    # check succeeds next time and nothing is regenerated.
+                    print("    -> Contents unchanged.")
+                    print("    -> Up-to-date. Skipping.")
+                    now = time.time_ns()
+                    for path in (elf_path, elf_path.replace(".elf", ".hex"), elf_path.replace(".elf", ".bin")):
+                        if (self._mtime(path) or 0) >= elf_mtime:
+                            os.utime(path, ns=(now, now))
+                            self._stat_cache.pop(path, None)
+                    return elf_path
 
-        print("📊 Calculating size...")
-        self.run_command([self.sz, elf_path])
+        self.run_command(cmd)
+        self._stat_cache.pop(elf_path, None)
+        with open(elf_path + ".cmdhash", 'w') as f:
+            f.write(f"{cmd_hash}\n{self._link_inputs_digest(inputs)}")
         return elf_path
 
+    def _link_inputs_digest(self, inputs):
+        """Returns a digest over the contents of the link inputs (objects and linker script)."""
+        digest = hashlib.blake2b(digest_size=16)
+        for path in inputs:
+            try:
+                digest.update(self._content_digest(path))
+            except OSError:
+                return ""
+        return digest.hexdigest()
+
     def create_binaries(self, elf_path):
-        """Creates .hex and .bin files from the .elf file for programming."""
-        print("📦 Creating final binaries...")
+        """
+        Creates .hex and .bin files from the .elf file for programming and prints its size.
+        Only the .hex needs objcopy; the .bin and the size are read from the .elf
+        in-process. Outputs that are newer than the .elf are not regenerated.
+        """
+        print("📦 Creating final binaries and calculating size...")
         hex_path = elf_path.replace(".elf", ".hex")
         bin_path = elf_path.replace(".elf", ".bin")
-        self.run_command([self.cp, "-O", "ihex", elf_path, hex_path])
-        self.run_command([self.cp, "-O", "binary", "-S", elf_path, bin_path])
+        elf_mtime = self._mtime(elf_path)
+        self.print_size(elf_path)
+        if (self._mtime(hex_path) or 0) < elf_mtime:
+            self.run_command([self.cp, "-O", "ihex", elf_path, hex_path])
+        if (self._mtime(bin_path) or 0) < elf_mtime:
+            try:
+                _elf_to_bin(elf_path, bin_path)
+            except (OSError, ValueError, struct.error):
+                self.run_command([self.cp, "-O", "binary", "-S", elf_path, bin_path])
+        self._stat_cache.pop(hex_path, None)
+        self._stat_cache.pop(bin_path, None)
         print(f"Successfully created binaries in {self.build_dir}/")
 
+    def print_size(self, elf_path):
+        """
+        Prints the text, data and bss sizes of the .elf in the format of 'size',
+        parsing the section headers directly instead of starting a process. Falls
+        back to the toolchain's 'size' if the file cannot be parsed.
+        """
+        try:
+            text, data, bss = _elf_size(elf_path)
+        except (OSError, ValueError, struct.error):
+            self.run_command([self.sz, elf_path])
+            return
+        total = text + data + bss
+        print("   text\t   data\t    bss\t    dec\t    hex\tfilename")
+        print(f"{text:7d}\t{data:7d}\t{bss:7d}\t{total:7d}\t{total:7x}\t{elf_path}")
+
+    def _write_ninja(self):
+        """
+        Writes a 'build.ninja' file describing the whole build into the build directory.
+
+        Every source becomes one 'build' statement. Ninja reads the gcc '-MMD -MP'
+        dependency files itself ('deps = gcc'), schedules the compile jobs in
+        parallel and re-runs any edge whose command line has changed.
+        All paths are relative to the repository root, which is where Ninja must
+        be invoked from.
+
+        Returns:
+            str: The path to the generated Ninja file.
+        """
+        self._prepare_build()
+        os.makedirs(self.build_dir, exist_ok=True)
+        ninja_path = os.path.join(self.build_dir, "build.ninja")
+        elf_path = os.path.join(self.build_dir, f"{self.config.TARGET_NAME}.elf")
+        hex_path = elf_path.replace(".elf", ".hex")
+        bin_path = elf_path.replace(".elf", ".bin")
+        linker = (self.cpp if self.is_cpp_project else self.cc)[-1]
+        esc = _ninja_escape_path
+        if self.use_response_files:
+            # Backslashes are escape characters in gcc response files, and the
+            # object paths reach the link response file through $in unquoted.
+            esc = lambda path: _ninja_escape_path(path.replace('\\', '/'))
+
+        def rule(name, tool, flags, inputs, description, deps=True):
+            """Returns the lines of a rule running 'tool flags inputs -o $out'."""
+            if not self.use_response_files:
+                rule_lines = [f"  command = {_ninja_command((*tool, *flags))} {inputs} -o $out"]
+            elif inputs == "$in":
+                # As in the built-in engine, the object list of the link goes into
+                # a response file, since it alone can exceed the Windows limit.
+                rule_lines = [
+                    f"  command = {_ninja_command((*tool, *flags))} @$out.rsp -o $out",
+                    "  rspfile = $out.rsp",
+                    "  rspfile_content = $in",
+                ]
+            else:
+                # Compiles pass their shared flags through a response file instead.
+                # Ninja writes it before running the command and re-runs the edge
+                # when its content changes.
+                content = " ".join(_quote_response_arg(arg) for arg in flags).replace('$', '$$')
+                rule_lines = [
+                    f"  command = {_ninja_command(tool)} @$out.rsp {inputs} -o $out",
+                    "  rspfile = $out.rsp",
+                    f"  rspfile_content = {content}",
+                ]
+            if deps:
+                rule_lines += ["  depfile = $dep", "  deps = gcc"]
+            return [f"rule {name}", *rule_lines, f"  description = {description}", ""]
+
+        lines = [
+            "# Generated by bldmgr/build_logic.py. Do not edit.",
+            f"builddir = {esc(self.build_dir)}",
+            "",
+            *rule("cc", self.cc, self.cflags, "-c $in", "CC $in"),
+            *rule("cxx", self.cpp, self.cppflags, "-c $in", "CXX $in"),
+            *rule("as", self.asm, self.asflags, "-c $in", "AS $in", deps=False),
+            *rule("link", (linker,), self.ldflags, "$in", "LINK $out", deps=False),
+            "rule hex",
+            f"  command = {_ninja_command([self.cp, '-O', 'ihex'])} $in $out",
+            "  description = HEX $out",
+            "",
+            "rule bin",
+            f"  command = {_ninja_command([self.cp, '-O', 'binary', '-S'])} $in $out",
+            "  description = BIN $out",
+            "",
+        ]
+
+        object_files = []
+        for src in self.c_sources + self.cpp_sources + self.asm_sources:
+            obj_path = self.obj_paths[src]
+            object_files.append(obj_path)
+            rule = self._source_kind(src)
+            lines.append(f"build {esc(obj_path)}: {rule} {esc(src)}")
+            if rule != "as":
+                lines.append(f"  dep = {esc(self._get_dep_path(obj_path))}")
+
+        lines += [
+            "",
+            f"build {esc(elf_path)}: link {' '.join(esc(o) for o in object_files)} | {esc(self.config.LINKER_SCRIPT)}",
+            f"build {esc(hex_path)}: hex {esc(elf_path)}",
+            f"build {esc(bin_path)}: bin {esc(elf_path)}",
+            "",
+            f"default {esc(hex_path)} {esc(bin_path)}",
+            "",
+        ]
+
+        with open(ninja_path, 'w') as f:
+            f.write("\n".join(lines))
+        return ninja_path
+
+    def _build_with_ninja(self):
+        """Generates the Ninja file and lets Ninja compile, link, and create binaries."""
+        print("🥷 Building with Ninja...")
+        ninja_path = self._write_ninja()
+        # Use the same job count as the built-in engine, so BUILD_JOBS and the
+        # distcc host count apply to Ninja builds as well.
+        self.run_command(["ninja", "-f", ninja_path, "-j", str(self.build_jobs)])
+
+        print("📊 Calculating size...")
+        elf_path = os.path.join(self.build_dir, f"{self.config.TARGET_NAME}.elf")
+        self.print_size(elf_path)
+
     def build_all(self):
         """Runs the entire build process: compile (incrementally), link, and create binaries."""
-        objects = self.compile_sources()
-        elf_file = self.link_objects(objects)
-        self.create_binaries(elf_file)
+        if self.use_ninja:
+            self._build_with_ninja()
+        else:
+            objects = self.compile_sources()
+            elf_file = self.link_objects(objects)
+            self.create_binaries(elf_file)
         print("\n✅ Build complete.")
 
     def program_dfu(self):
-        """Builds and programs the target using dfu-util."""
-        self.build_all()
+        """
+        Programs the target using dfu-util.
+        Does not build; the CLI runs build_all() first for the 'dfu' command.
+        """
         print("🔌 Programming with dfu-util...")
         bin_path = os.path.join(self.build_dir, f"{self.config.TARGET_NAME}.bin")
         if not os.path.exists(bin_path):
@@ -354,8 +1633,11 @@ class Builder:
         sys.exit(1)
 
     def program_openocd(self):
-        """Builds and programs the target using a generic OpenOCD configuration."""
-        self.build_all()
+        """
+        Programs the target using a generic OpenOCD configuration.
+        Does not build, so the 'program' command flashes the existing binary;
+        the CLI runs build_all() first for the 'flash' command.
+        """
         print("🔌 Programming with OpenOCD...")
         hex_path = os.path.join(os.getcwd(), self.build_dir, f"{self.config.TARGET_NAME}.hex").replace('\\', '/')
         if not os.path.exists(hex_path):
@@ -371,8 +1653,10 @@ class Builder:
         print("✅ OpenOCD Programming complete.")
 
     def program_openocd_nucleus(self):
-        """Builds and programs the target using the Nuclei-specific OpenOCD configuration."""
-        self.build_all()
+        """
+        Programs the target using the Nuclei-specific OpenOCD configuration.
+        Does not build; the CLI runs build_all() first for the 'nucleus' command.
+        """
         print("🔌 Programming with Nuclei OpenOCD...")
         hex_path = os.path.join(os.getcwd(), self.build_dir, f"{self.config.TARGET_NAME}.hex").replace('\\', '/')
         if not os.path.exists(hex_path):
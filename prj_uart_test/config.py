@@ -97,4 +97,14 @@ C_WARNING_FLAGS = config.C_WARNING_FLAGS
 CPP_WARNING_FLAGS = config.CPP_WARNING_FLAGS.copy()
 CPP_WARNING_FLAGS.remove("-Wold-style-cast")  # Not needed for this project
 CPP_EMBEDDED_FLAGS = config.CPP_EMBEDDED_FLAGS
-LIBRARIES = config.LIBRARIES
\ No newline at end of file
+LIBRARIES = config.LIBRARIES
+USE_NINJA = config.USE_NINJA
+BUILD_JOBS = config.BUILD_JOBS
+USE_CCACHE = config.USE_CCACHE
+USE_DISTCC = config.USE_DISTCC
+COMPILE_BATCH_SIZE = config.COMPILE_BATCH_SIZE
+UNITY_BUILD = config.UNITY_BUILD
+UNITY_BATCH_SIZE = config.UNITY_BATCH_SIZE
+NO_UNITY = config.NO_UNITY
+ENABLE_LTO = config.ENABLE_LTO
+TOOL_SHA256 = config.TOOL_SHA256
\ No newline at end of file
@@ -22,6 +22,11 @@ OPENOCD_PATH = "tools/OpenOCD_0.12.0/bin/openocd.exe"
 # Path to the dfu-util executable (can be just the name if it's in the system PATH).
 DFU_UTIL_PATH = "dfu-util"
 
+# Known SHA-256 digests of the tool archives downloaded when a tool is missing,
+# keyed by download URL, e.g. {"https://.../openocd-v0.12.0-i686-w64-mingw32.tar.gz": "<hex digest>"}.
+# A listed archive whose digest does not match is rejected.
+TOOL_SHA256 = {}
+
 
 # ==============================================================================
 # Generic Compiler & Linker Flags
@@ -50,4 +55,48 @@ CPP_WARNING_FLAGS = ["-Wnon-virtual-dtor", "-Wold-style-cast"]
 CPP_EMBEDDED_FLAGS = ["-fno-exceptions", "-fno-rtti", "-fno-threadsafe-statics"]
 
 # Standard libraries to link against.
-LIBRARIES = ["-lc", "-lm", "-lnosys"]
\ No newline at end of file
+LIBRARIES = ["-lc", "-lm", "-lnosys"]
+
+
+# ==============================================================================
+# Build System Configuration
+# ==============================================================================
+# Set to True to generate a 'build.ninja' file and let Ninja drive the build
+# (compile, link and objcopy) whenever 'ninja' is found in the PATH. Without
+# Ninja, or when set to False, the built-in incremental build is used.
+USE_NINJA = True
+
+# Number of compile jobs run in parallel. None uses one job per CPU core.
+BUILD_JOBS = None
+
+# Set to True to run compiles through 'ccache' (or 'sccache') when one of them
+# is found in the PATH.
+USE_CCACHE = True
+
+# Set to True to distribute compiles over the network with 'distcc' (hosts are
+# taken from the DISTCC_HOSTS environment variable). Combined with ccache, distcc
+# is only used on cache misses. Without BUILD_JOBS, 4 jobs per host are run; set
+# DISTCC_HOSTS_COUNT to the number of hosts.
+USE_DISTCC = False
+
+# Compile up to this many sources of the same language with a single compiler
+# invocation ('gcc -c a.c b.c ...'), which saves the start-up cost of a compiler
+# process per file. 0 or 1 compiles every source separately; "auto" splits the
+# sources that need compiling into one batch per parallel build job.
+COMPILE_BATCH_SIZE = 0
+
+# Set to True to compile the C sources as 'unity' translation units: groups of
+# UNITY_BATCH_SIZE files '#include'd into one generated file, so the headers they
+# share are parsed once per group. Speeds up full rebuilds, but a change to any
+# file recompiles its whole group, and sources must not define conflicting
+# 'static' names. Sources listed in NO_UNITY (paths relative to the repository
+# root, e.g. "prj_usb_serial/src/main.c") are always compiled on their own.
+UNITY_BUILD = False
+UNITY_BATCH_SIZE = 16
+NO_UNITY = []
+
+# Set to True to enable link-time optimization. Lets the linker optimize and drop
+# unused code across source files (in addition to '--gc-sections'), which
+# usually shrinks the firmware; the link step then runs the code generation in
+# parallel on all cores.
+ENABLE_LTO = False
@@ -108,4 +108,7 @@ def cycle_theme():
     print(f"\n--- Theme Cycled to: {new_theme['name']} ---")
 
 # -- State File --
-STATE_IMAGE_PATH = "current_display.png"
\ No newline at end of file
+STATE_IMAGE_PATH = "current_display.png"
+# The displayed image is only written every this many updates (and on exit),
+# to keep PNG encoding and disk I/O out of the update loop.
+STATE_IMAGE_SAVE_INTERVAL = 10
\ No newline at end of file
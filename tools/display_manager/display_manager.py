@@ -21,6 +21,12 @@ import hid
 import sys
 import threading
 
+try:
+    import numpy as np
+except ImportError:
+    # NumPy is optional; without it, pixels are converted with Pillow.
+    np = None
+
 # --- Make imports robust by adding the script's directory to the path ---
 # This allows the script to be run from any directory.
 _SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -36,6 +42,43 @@ import ui_generator
 # and the listener thread sets it.
 theme_change_requested = [False]
 
+# Lookup tables mapping an 8-bit channel value to its share of the high and
+# low RGB565 byte, built once so Pillow does not re-evaluate a lambda for all
+# 256 values on every conversion.
+_R_HIGH_LUT = [r & 0xF8 for r in range(256)]
+_G_HIGH_LUT = [g >> 5 for g in range(256)]
+_G_LOW_LUT = [(g & 0x1C) << 3 for g in range(256)]
+_B_LOW_LUT = [b >> 3 for b in range(256)]
+
+def image_to_rgb565(image: Image.Image) -> bytes:
+    """
+    Converts an RGB image to the 16-bit RGB565 format of the LCD
+    (RRRRRGGG GGGBBBBB, little-endian).
+
+    With NumPy, the whole buffer is converted in a few vectorized operations.
+    Otherwise, Pillow builds the two output bytes of every pixel from its
+    channels, which also runs in C rather than in a Python loop per pixel.
+    (Pillow has no raw packer for RGB565, so `tobytes("raw", "BGR;16")` is
+    not an option.)
+
+    Args:
+        image (PIL.Image.Image): The RGB image to convert.
+
+    Returns:
+        bytes: Two bytes per pixel, row by row.
+    """
+    if np is not None:
+        rgb = np.asarray(image, dtype=np.uint16).reshape(-1, 3)
+        pixels = ((rgb[:, 0] & 0xF8) << 8) | ((rgb[:, 1] & 0xFC) << 3) | (rgb[:, 2] >> 3)
+        return pixels.astype('<u2').tobytes()
+
+    r, g, b = image.split()
+    # The masked bit fields never overlap, so adding them is the same as OR-ing.
+    high = ImageChops.add(r.point(_R_HIGH_LUT), g.point(_G_HIGH_LUT))
+    low = ImageChops.add(g.point(_G_LOW_LUT), b.point(_B_LOW_LUT))
+    # A two-band image serializes as interleaved (low, high) byte pairs.
+    return Image.merge("LA", (low, high)).tobytes()
+
 class DeviceManager:
     """Manages low-level HID communication with the Longan Nano device."""
     def __init__(self):
@@ -84,34 +127,43 @@ class DeviceManager:
         Raises:
             OSError: If a HID write operation fails, indicating a likely disconnection.
         """
-        sent_bytes = 0
         # The actual payload size per report is the report length minus the overhead
         # for the Report ID (1 byte) and the Command ID (1 byte).
         payload_size = config.REPORT_LENGTH - 1
-        while sent_bytes < len(data):
-            chunk = data[sent_bytes : sent_bytes + payload_size]
+        # Build every packet up front so the write loop below does nothing but write.
+        packets = []
+        for offset in range(0, len(data), payload_size):
+            chunk = data[offset : offset + payload_size]
             packet = bytearray([config.REPORT_ID, config.CMD_IMAGE_DATA])
             packet.extend(chunk)
             packet.extend([0] * (config.REPORT_LENGTH - len(packet)))
-            bytes_written = self.device.write(packet)
-            if bytes_written < 0: raise OSError("HID write failed. Device may be disconnected.")
-            sent_bytes += len(chunk)
-            # A small delay is crucial for flow control. It gives the firmware time
-            # to process the incoming packet and write it to the LCD's DMA buffer
-            # before the next packet arrives.
-            time.sleep(0.001) 
+            packets.append(bytes(packet))
+
+        # The packets are written back-to-back. The firmware copies each one into its
+        # framebuffer as soon as it arrives, and the interrupt endpoint NAKs while it
+        # is busy, so USB itself paces the transfer. Only a failed write backs off
+        # and retries before the device is given up on.
+        for packet in packets:
+            delay = 0.001
+            while self.device.write(packet) < 0:
+                if delay > 0.008: raise OSError("HID write failed. Device may be disconnected.")
+                time.sleep(delay)
+                delay *= 2
 
     def send_rect_update(self, image: Image.Image, bbox: tuple[int, int, int, int]):
         """
         Sends a rectangular portion of an image to the device.
 
         This function implements the core display update protocol:
-        1.  If the update area is too large for the device's buffer, it is
-            recursively split into smaller, horizontal chunks.
-        2.  A `CMD_DRAW_RECT` command packet is sent, containing the
-            coordinates (x, y), dimensions (w, h), and a sequence number.
-        3.  The corresponding image data is cropped, converted from RGB to
-            RGB565 format, and sent as a data payload.
+        1.  The image data of the whole area is cropped and converted from RGB
+            to RGB565 format once.
+        2.  If the update area is too large for the device's buffer, it is
+            split into horizontal strips. Each strip's data is a contiguous
+            slice of the converted area, so full-frame and partial updates take
+            the same path.
+        3.  For each strip, a `CMD_DRAW_RECT` command packet is sent, containing
+            the coordinates (x, y), dimensions (w, h), and a sequence number,
+            followed by the strip's data payload.
 
         Args:
             image (Image.Image): The full PIL Image object.
@@ -124,42 +176,32 @@ class DeviceManager:
         x1, y1, x2, y2 = bbox
         width, height = x2 - x1, y2 - y1
         if width <= 0 or height <= 0: return
-        if width * height > config.MAX_PIXELS_PER_CHUNK:
-            rows_per_chunk = config.MAX_PIXELS_PER_CHUNK // width or 1
-            # Iterate through the large bounding box in horizontal strips.
-            for y_offset in range(0, height, rows_per_chunk):
-                chunk_height = min(rows_per_chunk, height - y_offset)
-                new_bbox = (x1, y1 + y_offset, x2, y1 + y_offset + chunk_height)
-                # Recursively call this function for each smaller chunk.
-                self.send_rect_update(image, new_bbox)
-            return
-        print(f"--- Sending Tile #{self.sequence_number} at ({x1},{y1}) size {width}x{height} ---")
-        
+
         # Crop the image and convert from 8-bits-per-channel RGB to 16-bit RGB565.
-        img_data = image.crop(bbox).tobytes("raw", "RGB")
-        pixel_data_rgb565 = bytearray()
-        for i in range(0, len(img_data), 3):
-            r, g, b = img_data[i:i+3]
-            # Bitwise operations to pack the 24-bit color into 16 bits.
-            # RRRRRGGG GGGBBBBB
-            rgb565 = ((r & 0xF8) << 8) | ((g & 0xFC) << 3) | (b >> 3)
-            # Append the 16-bit value as two bytes (little-endian).
-            pixel_data_rgb565.extend(rgb565.to_bytes(2, 'little'))
-        
-        # Construct the command packet payload.
-        seq_lsb = self.sequence_number & 0xFF
-        seq_msb = (self.sequence_number >> 8) & 0xFF
-        payload = bytearray([x1, y1, width, height, seq_lsb, seq_msb])
-        
-        # Prepend Report ID and Command ID, then pad to the required report length.
-        command_packet = bytearray([config.REPORT_ID, config.CMD_DRAW_RECT])
-        command_packet.extend(payload)
-        command_packet.extend([0] * (config.REPORT_LENGTH - len(command_packet)))
-        bytes_written = self.device.write(command_packet)
-        if bytes_written < 0: raise OSError("HID write failed. Device may be disconnected.")
-        time.sleep(0.005) # Wait for firmware to process the command.
-        self.send_data_payload(pixel_data_rgb565)
-        self.sequence_number = (self.sequence_number + 1) & 0xFFFF
+        pixel_data_rgb565 = image_to_rgb565(image.crop(bbox))
+        rows_per_chunk = max(1, min(height, config.MAX_PIXELS_PER_CHUNK // width))
+        bytes_per_row = width * 2
+        # Iterate through the bounding box in horizontal strips.
+        for y_offset in range(0, height, rows_per_chunk):
+            chunk_height = min(rows_per_chunk, height - y_offset)
+            y = y1 + y_offset
+            print(f"--- Sending Tile #{self.sequence_number} at ({x1},{y}) size {width}x{chunk_height} ---")
+
+            # Construct the command packet payload.
+            seq_lsb = self.sequence_number & 0xFF
+            seq_msb = (self.sequence_number >> 8) & 0xFF
+            payload = bytearray([x1, y, width, chunk_height, seq_lsb, seq_msb])
+
+            # Prepend Report ID and Command ID, then pad to the required report length.
+            command_packet = bytearray([config.REPORT_ID, config.CMD_DRAW_RECT])
+            command_packet.extend(payload)
+            command_packet.extend([0] * (config.REPORT_LENGTH - len(command_packet)))
+            bytes_written = self.device.write(command_packet)
+            if bytes_written < 0: raise OSError("HID write failed. Device may be disconnected.")
+            time.sleep(0.005) # Wait for firmware to process the command.
+            start = y_offset * bytes_per_row
+            self.send_data_payload(pixel_data_rgb565[start : start + chunk_height * bytes_per_row])
+            self.sequence_number = (self.sequence_number + 1) & 0xFFFF
 
     def close(self):
         """Closes the connection to the HID device."""
@@ -216,6 +258,8 @@ def main():
         os.remove(config.STATE_IMAGE_PATH)
 
     manager = DeviceManager()
+    previous_image = None
+    updates_since_save = 0
     
     # --- START OF MODIFICATION ---
     stop_event = threading.Event()
@@ -292,15 +336,21 @@ def main():
                         if bbox:
                             manager.send_rect_update(new_image, bbox)
 
-                    # Save the new image as the state for the next comparison.
-                    new_image.save(config.STATE_IMAGE_PATH)
+                    # Keep the new image as the state for the next comparison. It is
+                    # only written to disk every few updates.
                     previous_image = new_image
+                    updates_since_save += 1
+                    if updates_since_save >= config.STATE_IMAGE_SAVE_INTERVAL:
+                        previous_image.save(config.STATE_IMAGE_PATH)
+                        updates_since_save = 0
                     previous_time_string = time_string
                     # Wait a short time before checking for updates again.
                     time.sleep(1)
 
             except OSError as e:
                 print(f"\nDevice error or disconnection: {e}")
+                if previous_image:
+                    previous_image.save(config.STATE_IMAGE_PATH)
                 if listener_thread:
                     stop_event.set() # Signal the listener thread to stop
                     listener_thread.join(timeout=1) # Wait for it to exit
@@ -312,6 +362,8 @@ def main():
         print("\nExiting.")
     finally:
         # Ensure resources are cleaned up on exit.
+        if previous_image:
+            previous_image.save(config.STATE_IMAGE_PATH)
         if listener_thread:
             stop_event.set()
         if manager:
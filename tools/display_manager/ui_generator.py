@@ -7,23 +7,30 @@ to the device. It generates a background, draws weather icons, and arranges
 text elements in a clean, structured layout.
 """
 from PIL import Image, ImageDraw
+from functools import lru_cache
 from math import sin, cos, radians
 import config
 
-def _draw_vibrant_gradient_background() -> Image.Image:
+@lru_cache(maxsize=None)
+def _draw_vibrant_gradient_background(start_color: tuple, end_color: tuple) -> Image.Image:
     """
     Creates a visually appealing, high-contrast diagonal gradient background.
 
     The gradient is calculated based on the (x+y) position of each pixel,
     which produces a smooth diagonal transition between the start and end
-    colors defined in the configuration.
+    colors. Drawing it pixel by pixel is slow, so one image is cached per
+    theme; callers must copy it before drawing on it.
+
+    Args:
+        start_color (tuple): The (r, g, b) color of the top-left corner.
+        end_color (tuple): The (r, g, b) color towards the bottom-right corner.
 
     Returns:
         Image.Image: A PIL Image object with the generated gradient.
     """
     image = Image.new('RGB', (config.LCD_WIDTH, config.LCD_HEIGHT))
-    r1, g1, b1 = config.COLOR_GRADIENT_START
-    r2, g2, b2 = config.COLOR_GRADIENT_END
+    r1, g1, b1 = start_color
+    r2, g2, b2 = end_color
     
     # Calculate the maximum value for normalization
     max_val = float(config.LCD_WIDTH + config.LCD_HEIGHT)
@@ -39,13 +46,16 @@ def _draw_vibrant_gradient_background() -> Image.Image:
             image.putpixel((x, y), (r, g, b))
     return image
 
+@lru_cache(maxsize=32)
 def _create_weather_icon(icon_name: str, size: tuple[int, int]) -> Image.Image:
     """
     Generates high-quality, anti-aliased weather icons with a layered effect.
 
     Icons are drawn programmatically using PIL's Draw module. A subtle
     drop-shadow effect is achieved by drawing a semi-transparent, offset
-    version of the shape before drawing the main, opaque shape.
+    version of the shape before drawing the main, opaque shape. The weather
+    changes far less often than the clock, so icons are cached and must only
+    be read (e.g. pasted), never drawn on.
 
     Args:
         icon_name (str): The name of the icon to generate (e.g., "sun", "cloud").
@@ -194,7 +204,7 @@ def create_image(time_str: str, date_str: str, weather_info: dict | None) -> Ima
     Returns:
         Image.Image: The final, composed UI as an RGB PIL Image.
     """
-    image = _draw_vibrant_gradient_background()
+    image = _draw_vibrant_gradient_background(config.COLOR_GRADIENT_START, config.COLOR_GRADIENT_END).copy()
     # Create a transparent overlay to draw text and icons on
     overlay = Image.new('RGBA', image.size, (255, 255, 255, 0))
     draw = ImageDraw.Draw(overlay)
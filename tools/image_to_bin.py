@@ -1,6 +1,13 @@
+import struct
 import sys
 from PIL import Image
 
+try:
+    import numpy as np
+except ImportError:
+    # NumPy is optional; without it, pixels are converted in pure Python.
+    np = None
+
 # --- Configuration ---
 # The output path and dimensions remain fixed as they are tied to the device.
 OUTPUT_PATH = "image_160x80.bin"
@@ -23,16 +30,27 @@ def process_image(input_path):
 
         # Open the binary file for writing.
         with open(OUTPUT_PATH, "wb") as f:
-            # Iterate through each pixel in the resized image.
-            for r, g, b in img.getdata():
-                # Convert the 24-bit RGB888 pixel to a 16-bit RGB565 value.
-                # R: Top 5 bits -> [15:11]
-                # G: Top 6 bits -> [10:5]
-                # B: Top 5 bits -> [4:0]
-                pixel_value = ((r & 0b11111000) << 8) | ((g & 0b11111100) << 3) | (b >> 3)
-                
-                # Write the 16-bit value to the file as two bytes in little-endian format.
-                f.write(pixel_value.to_bytes(2, 'little'))
+            if np is not None:
+                # Convert all pixels at once with vectorized operations.
+                rgb = np.asarray(img, dtype=np.uint16).reshape(-1, 3)
+                pixels = ((rgb[:, 0] & 0xF8) << 8) | ((rgb[:, 1] & 0xFC) << 3) | (rgb[:, 2] >> 3)
+                f.write(pixels.astype('<u2').tobytes())
+            else:
+                # Otherwise, iterate through each pixel in the resized image.
+                # Pack into a preallocated buffer and write it in one go,
+                # instead of allocating and writing two bytes per pixel.
+                buf = bytearray(LCD_WIDTH * LCD_HEIGHT * 2)
+                pack_into = struct.Struct('<H').pack_into
+                for offset, (r, g, b) in enumerate(img.getdata()):
+                    # Convert the 24-bit RGB888 pixel to a 16-bit RGB565 value.
+                    # R: Top 5 bits -> [15:11]
+                    # G: Top 6 bits -> [10:5]
+                    # B: Top 5 bits -> [4:0]
+                    pixel_value = ((r & 0b11111000) << 8) | ((g & 0b11111100) << 3) | (b >> 3)
+
+                    # Store the 16-bit value as two bytes in little-endian format.
+                    pack_into(buf, offset * 2, pixel_value)
+                f.write(buf)
                 
         output_size = LCD_WIDTH * LCD_HEIGHT * 2
         print(f"\nSuccessfully created '{OUTPUT_PATH}' ({output_size} bytes).")